@@ -4,11 +4,23 @@ Uses OpenAI GPT-4o or Groq LLM to generate human-readable cleaning reports.
 """
 
 import os
-from typing import Dict, Any
+import re
+import asyncio
 import pandas as pd
 
 
-def generate_ai_report(
+# Module-level LLM clients, created on first use and reused across requests
+# so the underlying HTTP connections stay alive between reports
+_openai_client = None
+_groq_client = None
+
+# Markdown patterns used by format_ai_report_html
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_H3_RE = re.compile(r'^### (.*)$', re.MULTILINE)
+_H2_RE = re.compile(r'^## (.*)$', re.MULTILINE)
+
+
+async def generate_ai_report(
     original_df: pd.DataFrame,
     cleaned_df: pd.DataFrame,
     cleaning_steps: list,
@@ -23,7 +35,8 @@ def generate_ai_report(
         cleaned_df: DataFrame after cleaning
         cleaning_steps: List of cleaning operations performed
         summary: Summary statistics
-        ai_provider: 'openai' or 'groq'
+        ai_provider: 'openai' or 'groq'. Any other provider with an API key
+            configured is raced against it and the first successful reply wins.
     
     Returns:
         Formatted AI report as string
@@ -34,9 +47,15 @@ def generate_ai_report(
         f"- {step['description']}" for step in cleaning_steps
     ])
     
-    # Build data quality metrics
-    original_stats = _get_dataframe_stats(original_df)
-    cleaned_stats = _get_dataframe_stats(cleaned_df)
+    # Reuse the pipeline's missing-value counts instead of rescanning both frames
+    if 'missing_before' in summary:
+        missing_before = summary['missing_before']
+    else:
+        missing_before = original_df.isnull().sum().sum()
+    if 'missing_after' in summary:
+        missing_after = summary['missing_after']
+    else:
+        missing_after = cleaned_df.isnull().sum().sum()
     
     prompt = f"""
 Analyze this data cleaning operation and provide a concise, professional report.
@@ -46,7 +65,7 @@ ORIGINAL DATA:
 - Columns: {len(original_df.columns)}
 - Column names: {list(original_df.columns)[:10]}
 - Data types: {dict(original_df.dtypes.astype(str).head(10))}
-- Missing values: {original_df.isnull().sum().sum()}
+- Missing values: {missing_before}
 
 CLEANING OPERATIONS PERFORMED:
 {steps_description}
@@ -54,7 +73,7 @@ CLEANING OPERATIONS PERFORMED:
 CLEANED DATA:
 - Rows: {len(cleaned_df)}
 - Columns: {len(cleaned_df.columns)}
-- Missing values: {cleaned_df.isnull().sum().sum()}
+- Missing values: {missing_after}
 
 SUMMARY:
 - Rows removed: {summary.get('rows_removed', 0)}
@@ -72,30 +91,75 @@ Please provide:
 Keep the report concise (2-3 paragraphs) and actionable.
 """
     
+    ai_provider = ai_provider.lower()
+    if ai_provider not in _PROVIDERS:
+        return _fallback_report(summary)
+    
+    # Always try the requested provider; race it against the others that have keys
+    callers = [
+        call for name, (key_env, call) in _PROVIDERS.items()
+        if name == ai_provider or os.getenv(key_env)
+    ]
+    
     try:
-        if ai_provider.lower() == "openai":
-            return _call_openai(prompt)
-        elif ai_provider.lower() == "groq":
-            return _call_groq(prompt)
-        else:
-            return _fallback_report(summary)
+        return await _first_successful(callers, prompt)
     except Exception as e:
         # Fallback if API fails
         print(f"AI report generation failed: {str(e)}, using fallback")
         return _fallback_report(summary)
 
 
-def _call_openai(prompt: str) -> str:
+async def _first_successful(callers: list, prompt: str) -> str:
+    """
+    Run all provider calls concurrently and return the first successful reply.
+    Remaining calls are cancelled; raises the last error if every call fails.
+    """
+    pending = {asyncio.ensure_future(call(prompt)) for call in callers}
+    last_error = None
+    
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                last_error = task.exception()
+    finally:
+        for task in pending:
+            task.cancel()
+    
+    raise last_error
+
+
+def _pooled_http_client():
+    """Create an async HTTP client with keep-alive connection pooling."""
+    import httpx
+    
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_keepalive_connections=20,
+            max_connections=100,
+            keepalive_expiry=30.0
+        )
+    )
+
+
+async def _call_openai(prompt: str) -> str:
     """Call OpenAI API for report generation."""
-    from openai import OpenAI
+    global _openai_client
+    from openai import AsyncOpenAI
     
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OPENAI_API_KEY not set")
     
-    client = OpenAI(api_key=api_key)
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(api_key=api_key, http_client=_pooled_http_client())
+    client = _openai_client
     
-    response = client.chat.completions.create(
+    response = await client.chat.completions.create(
         model="gpt-4o",
         messages=[
             {
@@ -114,17 +178,20 @@ def _call_openai(prompt: str) -> str:
     return response.choices[0].message.content
 
 
-def _call_groq(prompt: str) -> str:
+async def _call_groq(prompt: str) -> str:
     """Call Groq API for report generation."""
-    from groq import Groq
+    global _groq_client
+    from groq import AsyncGroq
     
     api_key = os.getenv("GROQ_API_KEY")
     if not api_key:
         raise ValueError("GROQ_API_KEY not set")
     
-    client = Groq(api_key=api_key)
+    if _groq_client is None:
+        _groq_client = AsyncGroq(api_key=api_key, http_client=_pooled_http_client())
+    client = _groq_client
     
-    response = client.chat.completions.create(
+    response = await client.chat.completions.create(
         model="mixtral-8x7b-32768",
         messages=[
             {
@@ -143,6 +210,13 @@ def _call_groq(prompt: str) -> str:
     return response.choices[0].message.content
 
 
+# Supported providers: name -> (API key env var, report call)
+_PROVIDERS = {
+    "openai": ("OPENAI_API_KEY", _call_openai),
+    "groq": ("GROQ_API_KEY", _call_groq),
+}
+
+
 def _fallback_report(summary: dict) -> str:
     """Generate a fallback report if AI APIs fail."""
     
@@ -170,29 +244,18 @@ def _fallback_report(summary: dict) -> str:
     return report.strip()
 
 
-def _get_dataframe_stats(df: pd.DataFrame) -> Dict[str, Any]:
-    """Extract statistics from a DataFrame."""
-    stats = {
-        'rows': len(df),
-        'columns': len(df.columns),
-        'numeric_columns': len(df.select_dtypes(include=['number']).columns),
-        'missing_total': df.isnull().sum().sum(),
-        'memory_usage': df.memory_usage(deep=True).sum() / 1024 ** 2  # MB
-    }
-    return stats
-
-
 def format_ai_report_html(report: str) -> str:
     """Convert markdown report to HTML for frontend display."""
     
     # Simple markdown to HTML conversion
     html = report
     
-    # Convert headers
-    html = html.replace("## ", "<h2>").replace("### ", "<h3>")
+    # Convert headers (closing tags included)
+    html = _H3_RE.sub(r'<h3>\1</h3>', html)
+    html = _H2_RE.sub(r'<h2>\1</h2>', html)
     
-    # Convert bold
-    html = html.replace("**", "<strong>").replace("**", "</strong>")
+    # Convert bold, pairing each opening ** with its closing **
+    html = _BOLD_RE.sub(r'<strong>\1</strong>', html)
     
     # Convert line breaks to paragraphs
     paragraphs = html.split('\n\n')
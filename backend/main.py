@@ -7,17 +7,16 @@ Main application entry point with API endpoints for:
 
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 
 
 import os
-import tempfile
 import base64
-from io import StringIO, BytesIO
+from io import BytesIO
 import traceback
 
 from backend.cleaning_logic import DataCleaningPipeline, generate_python_script
-from backend.utils_serialization import to_serializable
 
 
 from backend.ai_report import generate_ai_report
@@ -46,11 +45,28 @@ class CleaningResponse(BaseModel):
     success: bool
     message: str
     cleaned_csv_base64: str = None
+    cleaned_csv_encoding: str = "gzip+base64"
     cleaning_script_base64: str = None
     ai_report: str = None
     summary: dict = None
 
 
+def _encode_csv_base64(df) -> str:
+    """
+    Serialize a DataFrame to CSV, gzip it and encode it as base64 for transmission.
+    CSV text compresses well, so this keeps large responses small.
+    """
+    # Write gzipped CSV bytes straight into one buffer (no intermediate str)
+    cleaned_csv_buffer = BytesIO()
+    df.to_csv(
+        cleaned_csv_buffer,
+        index=False,
+        compression={'method': 'gzip', 'compresslevel': 6}
+    )
+    
+    return base64.b64encode(cleaned_csv_buffer.getbuffer()).decode('ascii')
+
+
 @app.get("/health")
 async def health_check():
     """
@@ -67,7 +83,8 @@ async def clean_data(file: UploadFile = File(...)):
     
     Accepts: CSV file upload
     Returns:
-        - cleaned_csv_base64: Base64 encoded cleaned CSV
+        - cleaned_csv_base64: Gzip-compressed, base64 encoded cleaned CSV
+        - cleaned_csv_encoding: Encoding of cleaned_csv_base64 ("gzip+base64")
         - cleaning_script_base64: Base64 encoded Python script
         - ai_report: Human-readable cleaning report
         - summary: Cleaning statistics
@@ -81,71 +98,48 @@ async def clean_data(file: UploadFile = File(...)):
                 detail="Only CSV files are supported"
             )
         
-        # Read uploaded file
-        contents = await file.read()
+        # Run cleaning pipeline directly on the upload stream
+        pipeline = DataCleaningPipeline()
+        # pandas work is CPU-bound; keep it off the event loop
+        cleaned_df, cleaning_steps, summary = await run_in_threadpool(
+            pipeline.run_pipeline, file.file
+        )
         
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.csv', mode='wb') as tmp:
-            tmp.write(contents)
-            tmp_path = tmp.name
+        # Get original columns for script generation
+        original_columns = list(pipeline.original_df.columns)
         
-        try:
-            # Run cleaning pipeline
-            pipeline = DataCleaningPipeline()
-            cleaned_df, cleaning_steps, summary = pipeline.run_pipeline(tmp_path)
-            
-            summary = {k: to_serializable(v) for k, v in summary.items()}
-
-            cleaning_steps = [
-                {k: to_serializable(v) for k, v in step.items()}
-                for step in cleaning_steps
-            ]
-            # Get original columns for script generation
-            original_columns = list(pipeline.original_df.columns)
-            
-            # Generate Python cleaning script
-            cleaning_script = generate_python_script(cleaning_steps, original_columns)
-            
-            # Generate AI report
-            ai_provider = os.getenv("AI_PROVIDER", "openai").lower()
-            ai_report = generate_ai_report(
-                pipeline.original_df,
-                cleaned_df,
-                cleaning_steps,
-                summary,
-                ai_provider=ai_provider
-            )
-            
-            # Convert DataFrames to CSV strings
-            cleaned_csv_buffer = StringIO()
-            cleaned_df.to_csv(cleaned_csv_buffer, index=False)
-            cleaned_csv_str = cleaned_csv_buffer.getvalue()
-            
-            # Encode to base64 for transmission
-            cleaned_csv_base64 = base64.b64encode(
-                cleaned_csv_str.encode('utf-8')
-            ).decode('utf-8')
-            
-            cleaning_script_base64 = base64.b64encode(
-                cleaning_script.encode('utf-8')
-            ).decode('utf-8')
-            
-            # Prepare response
-            response = CleaningResponse(
-                success=True,
-                message="Data cleaned successfully",
-                cleaned_csv_base64=cleaned_csv_base64,
-                cleaning_script_base64=cleaning_script_base64,
-                ai_report=ai_report,
-                summary=summary
-            )
-            
-            return response.model_dump()
+        # Generate Python cleaning script
+        cleaning_script = generate_python_script(cleaning_steps, original_columns)
+        
+        # Generate AI report
+        ai_provider = os.getenv("AI_PROVIDER", "openai").lower()
+        ai_report = await generate_ai_report(
+            pipeline.original_df,
+            cleaned_df,
+            cleaning_steps,
+            summary,
+            ai_provider=ai_provider
+        )
+        
+        # Convert cleaned DataFrame to gzipped base64 CSV in a worker thread
+        cleaned_csv_base64 = await run_in_threadpool(_encode_csv_base64, cleaned_df)
+        
+        cleaning_script_base64 = base64.b64encode(
+            cleaning_script.encode('utf-8')
+        ).decode('utf-8')
+        
+        # Prepare response
+        response = CleaningResponse(
+            success=True,
+            message="Data cleaned successfully",
+            cleaned_csv_base64=cleaned_csv_base64,
+            cleaning_script_base64=cleaning_script_base64,
+            ai_report=ai_report,
+            summary=summary
+        )
         
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        # orjson serializes numpy scalars in the summary natively
+        return ORJSONResponse(content=response.model_dump())
     
     except HTTPException:
         raise
@@ -6,6 +6,13 @@ Handles common operations like string manipulation, date parsing, etc.
 import re
 from typing import Any
 
+# Max number of non-null values parsed when probing a column's type
+TYPE_DETECTION_SAMPLE_SIZE = 1000
+
+# Precompiled patterns for normalize_special_characters
+_SPECIAL_CHARS_RE = re.compile(r'[^a-z0-9\s\-._]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 def clean_string(value: str) -> str:
     """
@@ -32,8 +39,8 @@ def normalize_special_characters(value: str) -> str:
         return value
     
     # Keep only alphanumeric, spaces, and common punctuation
-    value = re.sub(r'[^a-z0-9\s\-._]', '', value)
-    value = re.sub(r'\s+', ' ', value).strip()
+    value = _SPECIAL_CHARS_RE.sub('', value)
+    value = _WHITESPACE_RE.sub(' ', value).strip()
     
     return value
 
@@ -68,27 +75,33 @@ def detect_column_type(series) -> str:
     import pandas as pd
     import numpy as np
     
+    # Already-typed columns need no parsing
+    if pd.api.types.is_numeric_dtype(series):
+        return 'numeric'
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return 'date'
+    
     # Remove null values for analysis
     non_null = series.dropna()
     
     if len(non_null) == 0:
         return 'unknown'
     
-    # Check if numeric
-    try:
-        pd.to_numeric(series, errors='coerce')
-        if pd.to_numeric(series, errors='coerce').notna().sum() > len(non_null) * 0.8:
-            return 'numeric'
-    except:
-        pass
+    # Probe a representative sample instead of parsing the whole column
+    if len(non_null) > TYPE_DETECTION_SAMPLE_SIZE:
+        probe = non_null.sample(TYPE_DETECTION_SAMPLE_SIZE, random_state=0)
+    else:
+        probe = non_null
+    
+    # Check if numeric (errors='coerce' never raises, parse once)
+    numeric = pd.to_numeric(probe, errors='coerce')
+    if numeric.notna().sum() > len(probe) * 0.8:
+        return 'numeric'
     
     # Check if date
-    try:
-        pd.to_datetime(series, errors='coerce')
-        if pd.to_datetime(series, errors='coerce').notna().sum() > len(non_null) * 0.8:
-            return 'date'
-    except:
-        pass
+    dates = pd.to_datetime(probe, errors='coerce', format='mixed')
+    if dates.notna().sum() > len(probe) * 0.8:
+        return 'date'
     
     # Check cardinality for categorical vs string
     unique_ratio = len(non_null.unique()) / len(non_null)
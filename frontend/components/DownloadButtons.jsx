@@ -10,8 +10,9 @@ export default function DownloadButtons({ cleaningResult }) {
    * Download file from base64 encoded data.
    * @param {string} base64Data - Base64 encoded file content
    * @param {string} filename - Name of file to download
+   * @param {string} [encoding] - 'gzip+base64' if the content was gzipped before encoding
    */
-  const downloadFile = (base64Data, filename) => {
+  const downloadFile = async (base64Data, filename, encoding = 'base64') => {
     // Decode base64 to binary
     const binaryString = atob(base64Data)
     const bytes = new Uint8Array(binaryString.length)
@@ -20,8 +21,13 @@ export default function DownloadButtons({ cleaningResult }) {
       bytes[i] = binaryString.charCodeAt(i)
     }
     
-    // Create blob and download
-    const blob = new Blob([bytes], { type: 'text/plain' })
+    // Create blob, inflating gzipped content first
+    let blob = new Blob([bytes], { type: 'text/plain' })
+    if (encoding === 'gzip+base64') {
+      const stream = blob.stream().pipeThrough(new DecompressionStream('gzip'))
+      blob = new Blob([await new Response(stream).arrayBuffer()], { type: 'text/plain' })
+    }
+    
     const url = window.URL.createObjectURL(blob)
     const link = document.createElement('a')
     link.href = url
@@ -37,7 +43,8 @@ export default function DownloadButtons({ cleaningResult }) {
         onClick={() =>
           downloadFile(
             cleaningResult.cleaned_csv_base64,
-            'cleaned_data.csv'
+            'cleaned_data.csv',
+            cleaningResult.cleaned_csv_encoding
           )
         }
         className="